@@ -1 +1,15 @@
-from databooks.data_models.notebook import JupyterNotebook
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from databooks.data_models.notebook import JupyterNotebook
+
+__all__ = ["JupyterNotebook"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import data models lazily, so that the CLI doesn't import them on startup."""
+    if name == "JupyterNotebook":
+        from databooks.data_models.notebook import JupyterNotebook
+
+        return JupyterNotebook
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
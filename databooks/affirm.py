@@ -2,9 +2,10 @@
 import ast
 from collections import abc
 from copy import deepcopy
+from functools import lru_cache
 from itertools import compress
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from databooks import JupyterNotebook
 from databooks.data_models.base import DatabooksBase
@@ -78,6 +79,12 @@ _ALLOWED_NODES = (
 )
 
 
+@lru_cache(maxsize=128)
+def _parse_expr(src: str) -> ast.Expression:
+    """Parse expression once - the tree is only visited, never modified."""
+    return ast.parse(src, mode="eval")
+
+
 class DatabooksParser(ast.NodeVisitor):
     """AST parser that disallows unsafe nodes/values."""
 
@@ -192,23 +199,29 @@ class DatabooksParser(ast.NodeVisitor):
          `databooks.affirm._ALLOWED_NODES` and built-ins from
          `databooks.affirm._ALLOWED_BUILTINS`.
         """
-        ast_tree = ast.parse(src, mode="eval")
-        return self.safe_eval_ast(ast_tree)
+        return self.safe_eval_ast(_parse_expr(src))
 
 
-def affirm(nb_path: Path, exprs: List[str], verbose: bool = False) -> bool:
+def affirm(
+    nb_path: Path,
+    exprs: List[str],
+    verbose: bool = False,
+    nb: Optional[JupyterNotebook] = None,
+) -> bool:
     """
     Return whether notebook passed all checks (expressions).
 
     :param nb_path: Path of notebook file
     :param exprs: Expression with check to be evaluated on notebook
     :param verbose: Log failed tests for notebook
+    :param nb: Already parsed notebook of `nb_path` (skips reading the file)
     :return: Evaluated expression cast as a `bool`
     """
     if verbose:
         set_verbose(logger)
 
-    nb = JupyterNotebook.parse_file(nb_path)
+    if nb is None:
+        nb = JupyterNotebook.parse_file(nb_path)
     variables: Dict[str, Any] = {
         "nb": nb,
         "raw_cells": [c for c in nb.cells if c.cell_type == "raw"],
@@ -3,7 +3,6 @@ from itertools import compress
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import tomli
 from rich.progress import (
     BarColumn,
     Progress,
@@ -14,17 +13,14 @@ from rich.progress import (
 from rich.prompt import Confirm
 from typer import Argument, BadParameter, Context, Exit, Option, Typer, echo
 
-from databooks.affirm import affirm_all
-from databooks.common import expand_paths
-from databooks.config import TOML_CONFIG_FILE, get_config
-from databooks.conflicts import conflicts2nbs, path2conflicts
-from databooks.git_utils import get_nb_diffs
+from databooks.common import ImgFmt, expand_paths
 from databooks.logging import get_logger
-from databooks.metadata import clear_all
 from databooks.recipes import Recipe
-from databooks.tui import ImgFmt, diffs2rich, nbs2rich
 from databooks.version import __version__
 
+# Commands' (and config's) heavier dependencies (data models, GitPython, etc.) are
+#  imported in function bodies - keeps `--version`, `--help` and completions fast
+
 logger = get_logger(__file__)
 
 app = Typer()
@@ -46,6 +42,8 @@ def _help_callback(ctx: Context, show_help: Optional[bool]) -> None:
 
 def _config_callback(ctx: Context, config_path: Optional[Path]) -> Optional[Path]:
     """Get config file and inject values into context to override default args."""
+    from databooks.config import TOML_CONFIG_FILE, get_config, get_config_fields
+
     target_paths = expand_paths(
         paths=[Path(p).resolve() for p in ctx.params.get("paths", ())]
     ) or [Path.cwd()]
@@ -59,13 +57,7 @@ def _config_callback(ctx: Context, config_path: Optional[Path]) -> Optional[Path
     )
     logger.debug(f"Loading config file from: {config_path}")
     if config_path is not None:  # config may not be specified
-        with config_path.open("rb") as f:
-            conf = (
-                tomli.load(f)
-                .get("tool", {})
-                .get("databooks", {})
-                .get(ctx.command.name, {})
-            )
+        conf = get_config_fields(config_path, command=ctx.command.name)
         # Merge configuration
         ctx.default_map = {
             **(ctx.default_map or {}),
@@ -154,6 +146,8 @@ def meta(
     ),
 ) -> None:
     """Clear both notebook and cell metadata."""
+    from databooks.metadata import clear_all
+
     nb_paths = _check_paths(paths=paths, ignore=ignore)
 
     if not bool(prefix + suffix) and not check:
@@ -254,6 +248,8 @@ def affirm_meta(
      `exec_cells` (notebook cells of `code` type that were executed - have an `execution
      count` value). Recipes can be found on `databooks.recipes.CookBook`.
     """
+    from databooks.affirm import affirm_all
+
     nb_paths = _check_paths(paths=paths, ignore=ignore)
     exprs = [r.name for r in recipe] + list(expr)
     if not exprs:
@@ -341,6 +337,8 @@ def fix(
      a valid notebook summarizing the differences - see
      [git docs](https://git-scm.com/docs/git-ls-files).
     """
+    from databooks.conflicts import conflicts2nbs, path2conflicts
+
     filepaths = expand_paths(paths=paths, ignore=ignore)
     if filepaths is None:
         raise RuntimeError(
@@ -413,6 +411,8 @@ def show(
     ),
 ) -> None:
     """Show rich representation of notebook."""
+    from databooks.tui import nbs2rich
+
     if export is not None and pager:
         raise BadParameter("Cannot use both pager and export output.")
     nb_paths = _check_paths(paths=paths, ignore=ignore)
@@ -478,6 +478,9 @@ def diff(
      means we can compare files that are staged with other branches, hashes, etc., or
      compare the current directory with the current index.
     """
+    from databooks.git_utils import get_nb_diffs
+    from databooks.tui import diffs2rich
+
     if export is not None and pager:
         raise BadParameter("Cannot use both pager and export output.")
     (ref_base, ref_remote), paths = _parse_paths(ref_base, ref_remote, paths=paths)
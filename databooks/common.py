@@ -1,4 +1,5 @@
 """Common set of miscellaneous functions."""
+from enum import Enum
 from itertools import chain
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
@@ -7,6 +8,8 @@ from databooks.logging import get_logger
 
 logger = get_logger(__file__)
 
+ImgFmt = Enum("ImgFmt", {"html": "HTML", "svg": "SVG", "text": "TXT"})
+
 
 def expand_paths(
     paths: List[Path], *, ignore: Sequence[str] = ("!*",), rglob: str = "*.ipynb"
@@ -54,7 +57,7 @@ def find_obj(
     obj_name: str, start: Path, finish: Path, is_dir: bool = False
 ) -> Optional[Path]:
     """
-    Recursively find file along directory path, from the end (child) directory to start.
+    Find file along directory path, from the end (child) directory to start.
 
     :param obj_name: File name to locate
     :param start: Start (parent) directory
@@ -67,20 +70,19 @@ def find_obj(
     if not start.is_dir():
         raise ValueError("Parameter `start` must be a directory.")
 
-    if start.resolve() not in [finish, *finish.resolve().parents]:
+    start, finish = start.resolve(), finish.resolve()
+    ancestors = (finish, *finish.parents)
+    if start not in ancestors:
         logger.debug(
             f"Parameter `start` is not a parent directory of `finish` (for {start} and"
             f" {finish}). Cannot find {obj_name}."
         )
         return None
 
-    is_obj = (finish / obj_name).is_dir() if is_dir else (finish / obj_name).is_file()
-    if is_obj:
-        return finish / obj_name
-    elif finish.samefile(start):
-        logger.debug(f"{obj_name} not found between {start} and {finish}.")
-        return None
-    else:
-        return find_obj(
-            obj_name=obj_name, start=start, finish=finish.parent, is_dir=is_dir
-        )
+    # Walk up the directories once, stopping at `start`
+    for directory in ancestors[: ancestors.index(start) + 1]:
+        obj_path = directory / obj_name
+        if obj_path.is_dir() if is_dir else obj_path.is_file():
+            return obj_path
+    logger.debug(f"{obj_name} not found between {start} and {finish}.")
+    return None
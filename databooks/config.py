@@ -1,7 +1,10 @@
 """Configuration functions, and settings objects."""
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import tomli
+
 from databooks.common import find_common_parent, find_obj
 from databooks.git_utils import get_repo
 from databooks.logging import get_logger
@@ -24,3 +27,16 @@ def get_config(target_paths: List[Path], config_filename: str) -> Optional[Path]
         start=Path(repo_dir) if repo_dir is not None else Path(common_path.anchor),
         finish=common_path,
     )
+
+
+@lru_cache(maxsize=8)
+def _load_toml(path: str, mtime_ns: int) -> ConfigFields:
+    """Parse TOML file - cached on path and modification time."""
+    with open(path, "rb") as f:
+        return tomli.load(f)
+
+
+def get_config_fields(config_path: Path, command: str) -> ConfigFields:
+    """Get the databooks configuration values for a given command."""
+    conf = _load_toml(str(config_path), config_path.stat().st_mtime_ns)
+    return dict(conf.get("tool", {}).get("databooks", {}).get(command, {}))
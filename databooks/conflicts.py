@@ -66,8 +66,8 @@ def conflict2nb(
     if verbose:
         set_verbose(logger)
 
-    nb_1 = JupyterNotebook.parse_raw(conflict_file.first_contents)
-    nb_2 = JupyterNotebook.parse_raw(conflict_file.last_contents)
+    nb_1 = JupyterNotebook.model_validate_json(conflict_file.first_contents)
+    nb_2 = JupyterNotebook.model_validate_json(conflict_file.last_contents)
     if nb_1.metadata != nb_2.metadata:
         msg = (
             f"Notebook metadata conflict for {conflict_file.filename}. Keeping "
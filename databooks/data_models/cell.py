@@ -35,10 +35,9 @@ class BaseCell(DatabooksBase):
 
     def __hash__(self) -> int:
         """Cells must be hashable for `difflib.SequenceMatcher`."""
-        return hash(
-            (type(self),) + tuple(v) if isinstance(v, list) else v
-            for v in self.__dict__.values()
-        )
+        # Equal cells must have equal hashes - source is required and always hashable
+        source = self.source
+        return hash((type(self), tuple(source) if isinstance(source, list) else source))
 
     def remove_fields(
         self, fields: Iterable[str] = (), missing_ok: bool = True, **kwargs: Any
@@ -245,7 +245,7 @@ class JupyterNotebook(DatabooksBase, extra=Extra.forbid):
             )
 
         path = Path(path) if not isinstance(path, Path) else path
-        return JupyterNotebook.model_validate_json(json_data=path.read_text())
+        return JupyterNotebook.model_validate_json(json_data=path.read_bytes())
 
     def write(
         self, path: Path | str, overwrite: bool = False, **json_kwargs: Any
@@ -258,10 +258,9 @@ class JupyterNotebook(DatabooksBase, extra=Extra.forbid):
                 f"File exists at {path} exists. Specify `overwrite = True`."
             )
 
-        self.__class__.model_validate(self.dict())
-
-        with path.open("w") as f:
-            json.dump(self.dict(), fp=f, **json_kwargs)
+        nb_dict = self.dict()
+        self.__class__.model_validate(nb_dict)
+        path.write_bytes(json.dumps(nb_dict, **json_kwargs).encode())
 
     def clear_metadata(
         self,
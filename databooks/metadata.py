@@ -42,7 +42,8 @@ def clear(
 
     if write_path is None:
         write_path = read_path
-    notebook = JupyterNotebook.parse_file(read_path)
+    nb_contents = read_path.read_bytes()
+    notebook = JupyterNotebook.model_validate_json(nb_contents)
 
     # Get fields to remove from cells and keep notebook schema
     cell_fields = {field for cell in notebook.cells for field, _ in cell if field}
@@ -58,7 +59,7 @@ def clear(
         cell_remove_fields=cell_remove_fields,
         **kwargs,
     )
-    nb_equals = notebook == JupyterNotebook.parse_file(read_path)
+    nb_equals = notebook == JupyterNotebook.model_validate_json(nb_contents)
 
     if nb_equals or check:
         msg = (
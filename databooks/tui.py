@@ -1,30 +1,74 @@
 """Terminal user interface (TUI) helper functions and components."""
 from contextlib import AbstractContextManager, nullcontext
-from dataclasses import asdict
-from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, overload
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union, overload
 
 from rich.columns import Columns
 from rich.console import Console
 from rich.rule import Rule
 from rich.theme import Theme
 
-from databooks.data_models.notebook import JupyterNotebook, NotebookMetadata
+from databooks.common import ImgFmt
+from databooks.data_models.notebook import (
+    Cell,
+    Cells,
+    JupyterNotebook,
+    NotebookMetadata,
+)
 from databooks.git_utils import DiffContents
 
 DATABOOKS_TUI = Theme({"in_count": "blue", "out_count": "orange3", "kernel": "bold"})
 
-ImgFmt = Enum("ImgFmt", {"html": "HTML", "svg": "SVG", "text": "TXT"})
+# Placeholder for missing side of diffs (added/deleted files) - validation is skipped
+_EMPTY_NB = JupyterNotebook.model_construct(
+    nbformat=0,
+    nbformat_minor=0,
+    metadata=NotebookMetadata.model_construct(),
+    cells=Cells[Cell]([]),
+)
+
+_EXPORTERS: Dict[ImgFmt, Callable[..., str]] = {
+    ImgFmt.html: Console.export_html,
+    ImgFmt.svg: Console.export_svg,
+    ImgFmt.text: Console.export_text,
+}
+
+
+@lru_cache(maxsize=None)
+def _databooks_console() -> Console:
+    """Get default console - instantiated once and only when needed."""
+    return Console(theme=DATABOOKS_TUI)
+
+
+def _get_context(
+    console: Console, *, context: Union[ImgFmt, bool]
+) -> AbstractContextManager:
+    """Get context manager for console (only the one needed is instantiated)."""
+    if isinstance(context, ImgFmt):
+        return console.capture()  # record outputs without printing them
+    return console.pager(styles=True) if context else nullcontext()
 
 
 def nb2rich(
     path: Path,
-    console: Console = Console(),
+    console: Optional[Console] = None,
 ) -> None:
     """Show rich representation of notebook in terminal."""
+    console = console if console is not None else _databooks_console()
     notebook = JupyterNotebook.parse_file(path)
-    console.print(Rule(path.resolve().name), notebook)
+    console.print(Rule(path.name), notebook)
+
+
+@overload
+def nbs2rich(
+    paths: List[Path],
+    *,
+    context: ImgFmt,
+    out: TextIO,
+    **kwargs: Any,
+) -> None:
+    ...
 
 
 @overload
@@ -52,6 +96,7 @@ def nbs2rich(
     *,
     context: Union[ImgFmt, bool] = False,
     export_kwargs: Optional[Dict[str, Any]] = None,
+    out: Optional[TextIO] = None,
     **console_kwargs: Any,
 ) -> Optional[str]:
     """
@@ -60,8 +105,9 @@ def nbs2rich(
     :param paths: notebook paths to print
     :param context: specify context - `ImgFmt` to export outputs, `True` for `pager`
     :param export_kwargs: keyword arguments for exporting prints (as a dictionary)
+    :param out: file-like object to write exported outputs to (instead of returning)
     :param console_kwargs: keyword arguments to be passed to `Console`
-    :return: console output if `context` is `ImgFmt`, else `None`
+    :return: console output if `context` is `ImgFmt` and no `out`, else `None`
     """
     if "record" in console_kwargs:
         raise ValueError(
@@ -69,45 +115,63 @@ def nbs2rich(
         )
     theme = console_kwargs.pop("theme", DATABOOKS_TUI)
     console = Console(record=isinstance(context, ImgFmt), theme=theme, **console_kwargs)
-    ctx_map: Dict[Union[ImgFmt, bool], AbstractContextManager] = {
-        True: console.pager(styles=True),
-        False: nullcontext(),
-    }
-    with ctx_map.get(context, console.capture()):
+    with _get_context(console, context=context):
         for path in paths:
             nb2rich(path, console=console)
     if isinstance(context, ImgFmt):
-        return getattr(console, f"export_{context.name}")(**(export_kwargs or {}))
+        exported = _EXPORTERS[context](console, **(export_kwargs or {}))
+        if out is None:
+            return exported
+        out.write(exported)
 
 
 def diff2rich(
     diff: DiffContents,
     *,
-    console: Console = Console(),
+    console: Optional[Console] = None,
+    half_width: Optional[int] = None,
 ) -> None:
-    """Show rich representation of notebook diff in terminal."""
-    a_nb, b_nb = (
-        JupyterNotebook.parse_raw(c)
-        if c is not None
-        else JupyterNotebook(
-            nbformat=0, nbformat_minor=0, metadata=NotebookMetadata(), cells=[]
-        )
-        for c in (diff.a.contents, diff.b.contents)
-    )
+    """
+    Show rich representation of notebook diff in terminal.
+
+    :param diff: `databooks.git_utils.DiffContents` for rendering
+    :param console: console to print to (defaults to `databooks` console)
+    :param half_width: width of the header columns - computed from console if `None`
+    :return:
+    """
+    console = console if console is not None else _databooks_console()
+    half_width = half_width if half_width is not None else console.width // 2
     cols = Columns(
         [
-            Rule(
-                f"{ab}/{c['path'].resolve().name if c['path'] is not None else 'null'}"
-            )
-            for ab, c in asdict(diff).items()
-            if ab in ("a", "b")
+            Rule(f"{ab}/{c.path.name if c.path is not None else 'null'}")
+            for ab, c in (("a", diff.a), ("b", diff.b))
         ],
-        width=console.width // 2,
+        width=half_width,
         padding=(0, 0),
     )
+    if diff.a.contents is not None and diff.a.contents == diff.b.contents:
+        # Identical contents - skip parsing and diffing the notebooks
+        console.print(cols, Rule("(no content diff)"))
+        return
+
+    a_nb, b_nb = (
+        JupyterNotebook.model_validate_json(c) if c is not None else _EMPTY_NB
+        for c in (diff.a.contents, diff.b.contents)
+    )
     console.print(cols, a_nb - b_nb)
 
 
+@overload
+def diffs2rich(
+    diffs: List[DiffContents],
+    *,
+    context: ImgFmt,
+    out: TextIO,
+    **kwargs: Any,
+) -> None:
+    ...
+
+
 @overload
 def diffs2rich(
     diffs: List[DiffContents],
@@ -133,6 +197,7 @@ def diffs2rich(
     *,
     context: Union[ImgFmt, bool] = False,
     export_kwargs: Optional[Dict[str, Any]] = None,
+    out: Optional[TextIO] = None,
     **console_kwargs: Any,
 ) -> Optional[str]:
     """
@@ -141,17 +206,18 @@ def diffs2rich(
     :param diffs: `databooks.git_utils.DiffContents` for rendering
     :param context: specify context - `ImgFmt` to export outputs, `True` for `pager`
     :param export_kwargs: keyword arguments for exporting prints (as a dictionary)
+    :param out: file-like object to write exported outputs to (instead of returning)
     :param console_kwargs: keyword arguments to be passed to `Console`
-    :return: console output if `context` is `ImgFmt`, else `None`
+    :return: console output if `context` is `ImgFmt` and no `out`, else `None`
     """
     theme = console_kwargs.pop("theme", DATABOOKS_TUI)
     console = Console(record=isinstance(context, ImgFmt), theme=theme, **console_kwargs)
-    ctx_map: Dict[Union[ImgFmt, bool], AbstractContextManager] = {
-        True: console.pager(styles=True),
-        False: nullcontext(),
-    }
-    with ctx_map.get(context, console.capture()):
+    half_width = console.width // 2
+    with _get_context(console, context=context):
         for diff in diffs:
-            diff2rich(diff, console=console)
+            diff2rich(diff, console=console, half_width=half_width)
     if isinstance(context, ImgFmt):
-        return getattr(console, f"export_{context.name}")(**(export_kwargs or {}))
+        exported = _EXPORTERS[context](console, **(export_kwargs or {}))
+        if out is None:
+            return exported
+        out.write(exported)
@@ -0,0 +1,24 @@
+from importlib import resources
+from pathlib import Path
+from typing import Generator
+
+from _pytest.tmpdir import TempPathFactory
+from git import Repo
+from pytest import fixture
+
+
+@fixture(scope="session")
+def files_dir() -> Generator[Path, None, None]:
+    """Directory with test files (notebooks and configuration), resolved once."""
+    with resources.path("tests.files", "__init__.py") as init_path:
+        yield init_path.parent
+
+
+@fixture(scope="session")
+def repo_template(tmp_path_factory: TempPathFactory) -> Path:
+    """Git repo with an initial (empty) commit on `main` - to be copied by tests."""
+    repo_dir = tmp_path_factory.mktemp("repo_template")
+    git_repo = Repo.init(path=repo_dir)
+    git_repo.git.checkout("-b", "main")
+    git_repo.git.commit("--allow-empty", "-m", "Initial commit")
+    return repo_dir
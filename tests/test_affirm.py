@@ -1,5 +1,5 @@
 import logging
-from importlib import resources
+from pathlib import Path
 
 import pytest
 from _pytest.logging import LogCaptureFixture
@@ -137,26 +137,26 @@ class TestSafeEval:
         assert parser.safe_eval("[e.a for e in l]") == [1, 1]
 
 
-def test_affirm(caplog: LogCaptureFixture) -> None:
+def test_affirm(caplog: LogCaptureFixture, files_dir: Path) -> None:
     """Affirm values in notebooks using string expressions."""
     caplog.set_level(logging.DEBUG)
-    with resources.path("tests.files", "demo.ipynb") as nb:
-        assert (
-            affirm(
-                nb,
-                [
-                    "len(nb.cells) == 6",
-                    "len(code_cells) == 4",
-                    "len(md_cells) == 1",
-                    "len(raw_cells) == 1",
-                ],
-            )
-            is True
+    nb = files_dir / "demo.ipynb"
+    assert (
+        affirm(
+            nb,
+            [
+                "len(nb.cells) == 6",
+                "len(code_cells) == 4",
+                "len(md_cells) == 1",
+                "len(raw_cells) == 1",
+            ],
         )
-        assert affirm(nb, ["nb.nbformat == 4"]) is True
-        assert affirm(nb, ["any('tags' in c.metadata for c in nb.cells)"]) is False
+        is True
+    )
+    assert affirm(nb, ["nb.nbformat == 4"]) is True
+    assert affirm(nb, ["any('tags' in c.metadata for c in nb.cells)"]) is False
 
-    logs = list(caplog.records)
+    logs = caplog.records
     assert len(logs) == 6
     assert logs[-2].message.endswith(" failed 1 of 1 checks.")
     assert logs[-1].message.endswith(
@@ -1,30 +1,105 @@
 import logging
-from copy import deepcopy
-from importlib import resources
+import os
 from pathlib import Path
-from textwrap import dedent
+from shutil import copytree
+from typing import List, Tuple
 
 from _pytest.logging import LogCaptureFixture
-from git import GitCommandError
-from pytest import raises
+from _pytest.tmpdir import TempPathFactory
+from click.testing import CliRunner
+from git import GitCommandError, Repo
+from pytest import fixture, raises
 from typer import Context
 from typer.core import TyperCommand
-from typer.testing import CliRunner
+from typer.main import get_command
 
 from databooks.cli import _config_callback, _parse_paths, app
-from databooks.data_models.cell import CellMetadata, CellOutputs, MarkdownCell, RawCell
+from databooks.data_models.cell import (
+    BaseCell,
+    CellMetadata,
+    CellOutputs,
+    MarkdownCell,
+    RawCell,
+)
 from databooks.data_models.notebook import JupyterNotebook, NotebookMetadata
 from databooks.git_utils import get_conflict_blobs
 from databooks.version import __version__
-from tests.test_data_models.test_notebook import TestJupyterNotebook
+from tests.test_data_models.test_notebook import extra_cell, make_test_nb, write_test_nb
 from tests.test_git_utils import init_repo_diff
 
 runner = CliRunner()
+cli = get_command(app)  # build click command once (instead of on every invoke)
+empty_cell_metadata = CellMetadata()
+empty_cell_outputs = CellOutputs([])
+conflict_separator_cell = MarkdownCell(
+    source=["`=======`"], metadata=empty_cell_metadata
+)
+
+
+def _conflict_marker_cells(
+    id_main: str, id_other: str, extra_cell: BaseCell
+) -> List[BaseCell]:
+    """Get the expected cells of a resolved conflict, including the git markers."""
+    return [
+        MarkdownCell(
+            metadata=CellMetadata(git_hash=id_main),
+            source=[f"`<<<<<<< {id_main}`"],
+        ),
+        conflict_separator_cell,
+        extra_cell,
+        MarkdownCell(
+            metadata=CellMetadata(git_hash=id_other),
+            source=[f"`>>>>>>> {id_other}`"],
+        ),
+    ]
+
+
+conflict_nb_path = Path("test_conflicts_nb.ipynb")
+
+
+def _conflicting_notebooks() -> Tuple[JupyterNotebook, JupyterNotebook]:
+    """Get the notebooks committed to `main` and `other` in the conflicted repo."""
+    notebook_1 = make_test_nb()
+    notebook_2 = make_test_nb()
+
+    notebook_1.metadata = NotebookMetadata(
+        kernelspec=dict(
+            display_name="different_kernel_display_name", name="kernel_name"
+        ),
+        field_to_remove=["Field to remove"],
+        another_field_to_remove="another field",
+    )
+    notebook_2.cells = notebook_2.cells + [extra_cell]
+    notebook_2.nbformat += 1
+    notebook_2.nbformat_minor += 1
+    return notebook_1, notebook_2
+
+
+@fixture(scope="module")
+def conflicted_repo_template(
+    tmp_path_factory: TempPathFactory, repo_template: Path
+) -> Path:
+    """Repo with a merge conflict in `conflict_nb_path` - to be copied by tests."""
+    repo_dir = tmp_path_factory.mktemp("conflicted_repo_template")
+    notebook_1, notebook_2 = _conflicting_notebooks()
+    git_repo = init_repo_diff(
+        tmp_path=repo_dir,
+        filename=conflict_nb_path,
+        contents_main=notebook_1.model_dump_json(),
+        contents_other=notebook_2.model_dump_json(),
+        commit_message_main="Notebook from main",
+        commit_message_other="Notebook from other",
+        repo_template=repo_template,
+    )
+    with raises(GitCommandError):
+        # merge fails and raises error due to conflict (single file, no renames)
+        git_repo.git.merge("other", strategy_option="no-renames")
+    return repo_dir
 
 
 def test_version_callback() -> None:
     """Print version and help."""
-    result = runner.invoke(app, ["--version"])
+    result = runner.invoke(cli, ["--version"])
     assert result.exit_code == 0
     assert f"databooks version: {__version__}\n" == result.stdout
 
@@ -42,95 +117,99 @@ def test_parse_paths() -> None:
     )
 
 
-def test_config_callback() -> None:
+def test_config_callback(files_dir: Path) -> None:
     """Overwrite default parameters from `typer.Context`."""
     ctx: Context = Context(TyperCommand(name="test-config"))
-    with resources.path("tests.files", "pyproject.toml") as conf:
-        assert ctx.default_map is None
-        parsed_config = _config_callback(ctx=ctx, config_path=conf)
-        assert ctx.default_map == dict(config_default="config-value")
-        assert parsed_config == conf
+    conf = files_dir / "pyproject.toml"
+    assert ctx.default_map is None
+    parsed_config = _config_callback(ctx=ctx, config_path=conf)
+    assert ctx.default_map == dict(config_default="config-value")
+    assert parsed_config == conf
+
+
+def test_config_callback__modified(tmp_path: Path) -> None:
+    """Re-read configuration file when it is modified."""
+    conf = tmp_path / "pyproject.toml"
+    conf.write_text('[tool.databooks.test-config]\nconfig-default = "old"\n')
+    ctx: Context = Context(TyperCommand(name="test-config"))
+    _config_callback(ctx=ctx, config_path=conf)
+    assert ctx.default_map == dict(config_default="old")
+
+    conf.write_text('[tool.databooks.test-config]\nconfig-default = "new"\n')
+    os.utime(conf, ns=(0, conf.stat().st_mtime_ns + 1))
+    ctx = Context(TyperCommand(name="test-config"))
+    _config_callback(ctx=ctx, config_path=conf)
+    assert ctx.default_map == dict(config_default="new")
 
 
 def test_meta(tmp_path: Path) -> None:
     """Remove notebook metadata."""
-    read_path = tmp_path / "test_meta_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(read_path)
+    read_path = tmp_path / "test_meta_nb.ipynb"
+    write_test_nb(read_path)
 
-    nb_read = JupyterNotebook.parse_file(path=read_path)
-    result = runner.invoke(app, ["meta", str(read_path), "--yes"])
+    nb_read = make_test_nb()  # contents of `read_path`
+    result = runner.invoke(cli, ["meta", str(read_path), "--yes"])
     nb_write = JupyterNotebook.parse_file(path=read_path)
 
     assert result.exit_code == 0
     assert len(nb_write.cells) == len(nb_read.cells)
-    assert all(cell.metadata == CellMetadata() for cell in nb_write.cells)
-    assert all(
-        cell.execution_count is None
-        for cell in nb_write.cells
-        if cell.cell_type == "code"
-    )
-    assert all(
-        not hasattr(cell, "outputs")
-        for cell in nb_write.cells
-        if cell.cell_type != "code"
-    )
-    assert all(
-        not hasattr(cell, "execution_count")
-        for cell in nb_write.cells
-        if cell.cell_type != "code"
-    )
+    for cell in nb_write.cells:
+        assert cell.metadata == empty_cell_metadata
+        if cell.cell_type == "code":
+            assert cell.execution_count is None
+        else:
+            assert "outputs" not in cell.model_fields_set
+            assert "execution_count" not in cell.model_fields_set
 
 
 def test_meta__check(tmp_path: Path, caplog: LogCaptureFixture) -> None:
     """Report on existing notebook metadata (both when it is and isn't present)."""
     caplog.set_level(logging.INFO)
 
-    read_path = tmp_path / "test_meta_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(read_path)
+    read_path = tmp_path / "test_meta_nb.ipynb"
+    write_test_nb(read_path)
 
-    nb_read = JupyterNotebook.parse_file(path=read_path)
-    result = runner.invoke(app, ["meta", str(read_path), "--check"])
+    nb_read = make_test_nb()  # contents of `read_path`
+    result = runner.invoke(cli, ["meta", str(read_path), "--check"])
     nb_write = JupyterNotebook.parse_file(path=read_path)
 
-    logs = list(caplog.records)
+    logs = caplog.records
     assert result.exit_code == 1
     assert len(logs) == 1
     assert nb_read == nb_write
     assert logs[0].message == "Found unwanted metadata in 1 out of 1 files."
 
     # Clean notebook and check again
-    runner.invoke(app, ["meta", str(read_path), "--yes"])
+    runner.invoke(cli, ["meta", str(read_path), "--yes"])
 
-    result = runner.invoke(app, ["meta", str(read_path), "--check"])
+    result = runner.invoke(cli, ["meta", str(read_path), "--check"])
 
-    logs = list(caplog.records)
+    logs = caplog.records
 
     assert result.exit_code == 0
     assert len(logs) == 4
     assert logs[-1].message == "No unwanted metadata!"
 
 
-def test_meta__config(tmp_path: Path) -> None:
+def test_meta__config(tmp_path: Path, files_dir: Path) -> None:
     """Check notebook metadata with configuration overriding defaults."""
-    read_path = tmp_path / "test_meta_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(read_path)
-
-    nb_read = JupyterNotebook.parse_file(path=read_path)
-    with resources.path("tests.files", "pyproject.toml") as config_path:
-        # Take arguments from config file
-        result = runner.invoke(
-            app, ["meta", str(read_path), "--config", str(config_path)]
-        )
+    read_path = tmp_path / "test_meta_nb.ipynb"
+    write_test_nb(read_path)
+
+    nb_read = make_test_nb()  # contents of `read_path`
+    config_path = files_dir / "pyproject.toml"
+    # Take arguments from config file
+    result = runner.invoke(cli, ["meta", str(read_path), "--config", str(config_path)])
     nb_write = JupyterNotebook.parse_file(path=read_path)
 
     assert result.exit_code == 0
     assert nb_read != nb_write, "Notebook was not overwritten"
-    assert all(c.outputs == CellOutputs([]) for c in nb_write.cells)
+    assert all(c.outputs == empty_cell_outputs for c in nb_write.cells)
     assert all(c.execution_count is not None for c in nb_write.cells)
 
     # Override config file arguments
     result = runner.invoke(
-        app, ["meta", str(read_path), "--rm-exec", "--config", str(config_path)]
+        cli, ["meta", str(read_path), "--rm-exec", "--config", str(config_path)]
     )
     nb_write = JupyterNotebook.parse_file(path=read_path)
 
@@ -140,23 +219,24 @@ def test_meta__config(tmp_path: Path) -> None:
 
 def test_meta__script(tmp_path: Path) -> None:
     """Raise `typer.BadParameter` when passing a script instead of a notebook."""
-    py_path = tmp_path / "a_script.py"  # type: ignore
+    py_path = tmp_path / "a_script.py"
     py_path.write_text("# some python code", encoding="utf-8")
 
-    result = runner.invoke(app, ["meta", str(py_path)])
+    result = runner.invoke(cli, ["meta", str(py_path)])
     assert result.exit_code == 2
     assert "Expected either notebook files, a directory or glob " in result.output
 
 
 def test_meta__no_confirm(tmp_path: Path) -> None:
     """Don't make any changes without confirmation to overwrite files (prompt)."""
-    nb_path = tmp_path / "test_meta_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(nb_path)
+    nb_path = tmp_path / "test_meta_nb.ipynb"
+    expected = make_test_nb()
+    write_test_nb(nb_path)
 
-    result = runner.invoke(app, ["meta", str(nb_path)])
+    result = runner.invoke(cli, ["meta", str(nb_path)])
 
     assert result.exit_code == 1
-    assert JupyterNotebook.parse_file(nb_path) == TestJupyterNotebook().jupyter_notebook
+    assert JupyterNotebook.parse_file(nb_path) == expected
     assert result.output.startswith(
         "1 files will be overwritten (no prefix nor suffix was passed)."
         " Continue? [y/n]:"
@@ -165,13 +245,14 @@ def test_meta__no_confirm(tmp_path: Path) -> None:
 
 def test_meta__confirm(tmp_path: Path) -> None:
     """Make changes when confirming overwrite via the prompt."""
-    nb_path = tmp_path / "test_meta_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(nb_path)
+    nb_path = tmp_path / "test_meta_nb.ipynb"
+    expected = make_test_nb()
+    write_test_nb(nb_path)
 
-    result = runner.invoke(app, ["meta", str(nb_path)], input="y")
+    result = runner.invoke(cli, ["meta", str(nb_path)], input="y")
 
     assert result.exit_code == 0
-    assert JupyterNotebook.parse_file(nb_path) != TestJupyterNotebook().jupyter_notebook
+    assert JupyterNotebook.parse_file(nb_path) != expected
     assert result.output == (
         "1 files will be overwritten (no prefix nor suffix was passed)."
         " Continue? [y/n]:"
@@ -182,16 +263,16 @@ def test_meta__confirm(tmp_path: Path) -> None:
 def test_meta__no_notebooks_found(tmp_path: Path, caplog: LogCaptureFixture) -> None:
     """Log that no notebook was found in the paths passed."""
     caplog.set_level(logging.INFO)
-    nb_path = tmp_path / "inexistent_nb.ipynb"  # type: ignore
+    nb_path = tmp_path / "inexistent_nb.ipynb"
 
-    result = runner.invoke(app, ["meta", str(nb_path), "--check"])
-    logs = list(caplog.records)
+    result = runner.invoke(cli, ["meta", str(nb_path), "--check"])
+    logs = caplog.records
     assert result.exit_code == 0
     assert len(logs) == 1
     assert logs[0].message == f"No notebooks found in {[Path(nb_path)]}. Nothing to do."
 
 
-def test_assert(caplog: LogCaptureFixture) -> None:
+def test_assert(files_dir: Path, caplog: LogCaptureFixture) -> None:
     """Assert that notebook has sequential and increasing cell execution."""
     caplog.set_level(logging.INFO)
 
@@ -199,12 +280,12 @@ def test_assert(caplog: LogCaptureFixture) -> None:
         "[c.execution_count for c in exec_cells] == list(range(1, len(exec_cells) + 1))"
     )
     recipe = "seq-increase"
-    with resources.path("tests.files", "demo.ipynb") as nb_path:
-        result = runner.invoke(
-            app, ["assert", str(nb_path), "--expr", exprs, "--recipe", recipe]
-        )
+    nb_path = files_dir / "demo.ipynb"
+    result = runner.invoke(
+        cli, ["assert", str(nb_path), "--expr", exprs, "--recipe", recipe]
+    )
 
-    logs = list(caplog.records)
+    logs = caplog.records
     assert result.exit_code == 0
     assert len(logs) == 2
     assert [log.message for log in logs] == [
@@ -213,16 +294,13 @@ def test_assert(caplog: LogCaptureFixture) -> None:
     ]
 
 
-def test_assert__config(caplog: LogCaptureFixture) -> None:
+def test_assert__config(files_dir: Path, caplog: LogCaptureFixture) -> None:
     """Assert notebook based on statements from configuration file."""
     caplog.set_level(logging.INFO)
 
-    with resources.path("tests.files", "pyproject.toml") as config:
-        nb_dirpath = config.parent
-        result = runner.invoke(
-            app, ["assert", str(nb_dirpath), "--config", str(config)]
-        )
-    logs = list(caplog.records)
+    config = files_dir / "pyproject.toml"
+    result = runner.invoke(cli, ["assert", str(files_dir), "--config", str(config)])
+    logs = caplog.records
     assert result.exit_code == 1
     assert len(logs) == 5
     assert (
@@ -231,55 +309,29 @@ def test_assert__config(caplog: LogCaptureFixture) -> None:
     )
 
 
-def test_fix(tmp_path: Path) -> None:
+def test_fix(tmp_path: Path, conflicted_repo_template: Path) -> None:
     """Fix notebook conflicts."""
     # Setup
-    nb_path = Path("test_conflicts_nb.ipynb")
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
-
-    notebook_1.metadata = NotebookMetadata(
-        kernelspec=dict(
-            display_name="different_kernel_display_name", name="kernel_name"
-        ),
-        field_to_remove=["Field to remove"],
-        another_field_to_remove="another field",
-    )
-
-    extra_cell = RawCell(
-        metadata=CellMetadata(random_meta=["meta"]),
-        source="extra",
-    )
-
-    notebook_2.cells = notebook_2.cells + [extra_cell]
-    notebook_2.nbformat += 1
-    notebook_2.nbformat_minor += 1
-
-    git_repo = init_repo_diff(
-        tmp_path=tmp_path,
-        filename=nb_path,
-        contents_main=notebook_1.json(),
-        contents_other=notebook_2.json(),
-        commit_message_main="Notebook from main",
-        commit_message_other="Notebook from other",
-    )
-
-    with raises(GitCommandError):
-        git_repo.git.merge("other")  # merge fails and raises error due to conflict
+    repo_dir = tmp_path / "repo"
+    copytree(conflicted_repo_template, repo_dir)
+    git_repo = Repo(repo_dir)
+    notebook_1, notebook_2 = _conflicting_notebooks()
 
     conflict_files = get_conflict_blobs(repo=git_repo)
     id_main = conflict_files[0].first_log
     id_other = conflict_files[0].last_log
 
     # Run CLI and check conflict resolution
-    result = runner.invoke(app, ["fix", str(tmp_path)])
-    fixed_notebook = JupyterNotebook.parse_file(path=tmp_path / nb_path)
+    result = runner.invoke(cli, ["fix", str(repo_dir)])
+    fixed_notebook = JupyterNotebook.parse_file(path=repo_dir / conflict_nb_path)
 
     assert len(conflict_files) == 1
     assert result.exit_code == 0
 
-    expected_metadata = deepcopy(notebook_2.metadata.dict())
-    expected_metadata.update(notebook_1.metadata.dict())
+    expected_metadata = {
+        **notebook_2.metadata.dict(),
+        **notebook_1.metadata.dict(),
+    }
     notebook_1.clear_metadata(
         notebook_metadata_remove=(),
         cell_metadata_remove=(),
@@ -288,77 +340,38 @@ def test_fix(tmp_path: Path) -> None:
     assert fixed_notebook.metadata == NotebookMetadata(**expected_metadata)
     assert fixed_notebook.nbformat == notebook_1.nbformat
     assert fixed_notebook.nbformat_minor == notebook_1.nbformat_minor
-    assert fixed_notebook.cells == notebook_1.cells + [
-        MarkdownCell(
-            metadata=CellMetadata(git_hash=id_main),
-            source=[f"`<<<<<<< {id_main}`"],
-        ),
-        MarkdownCell(
-            source=["`=======`"],
-            metadata=CellMetadata(),
-        ),
-        extra_cell,
-        MarkdownCell(
-            metadata=CellMetadata(git_hash=id_other),
-            source=[f"`>>>>>>> {id_other}`"],
-        ),
-    ]
+    assert fixed_notebook.cells == notebook_1.cells + _conflict_marker_cells(
+        id_main=id_main, id_other=id_other, extra_cell=extra_cell
+    )
 
 
-def test_fix__config(tmp_path: Path) -> None:
+def test_fix__config(
+    tmp_path: Path, conflicted_repo_template: Path, files_dir: Path
+) -> None:
     """Fix notebook conflicts with configuration overriding defaults."""
     # Setup
-    nb_path = Path("test_conflicts_nb.ipynb")
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
-
-    notebook_1.metadata = NotebookMetadata(
-        kernelspec=dict(
-            display_name="different_kernel_display_name", name="kernel_name"
-        ),
-        field_to_remove=["Field to remove"],
-        another_field_to_remove="another field",
-    )
-
-    extra_cell = RawCell(
-        metadata=CellMetadata(random_meta=["meta"]),
-        source="extra",
-    )
-
-    notebook_2.cells = notebook_2.cells + [extra_cell]
-
-    notebook_2.nbformat += 1
-    notebook_2.nbformat_minor += 1
-
-    git_repo = init_repo_diff(
-        tmp_path=tmp_path,
-        filename=nb_path,
-        contents_main=notebook_1.json(),
-        contents_other=notebook_2.json(),
-        commit_message_main="Notebook from main",
-        commit_message_other="Notebook from other",
-    )
-
-    with raises(GitCommandError):
-        git_repo.git.merge("other")  # merge fails and raises error due to conflict
+    repo_dir = tmp_path / "repo"
+    copytree(conflicted_repo_template, repo_dir)
+    git_repo = Repo(repo_dir)
+    notebook_1, notebook_2 = _conflicting_notebooks()
 
     conflict_files = get_conflict_blobs(repo=git_repo)
     id_main = conflict_files[0].first_log
     id_other = conflict_files[0].last_log
 
-    with resources.path("tests.files", "pyproject.toml") as config_path:
-        # Run CLI and check conflict resolution
-        result = runner.invoke(
-            app, ["fix", str(tmp_path), "--config", str(config_path)]
-        )
+    # Run CLI and check conflict resolution
+    config_path = files_dir / "pyproject.toml"
+    result = runner.invoke(cli, ["fix", str(repo_dir), "--config", str(config_path)])
 
-    fixed_notebook = JupyterNotebook.parse_file(path=tmp_path / nb_path)
+    fixed_notebook = JupyterNotebook.parse_file(path=repo_dir / conflict_nb_path)
 
     assert len(conflict_files) == 1
     assert result.exit_code == 0
 
-    expected_metadata = deepcopy(notebook_1.metadata.dict())
-    expected_metadata.update(notebook_2.metadata.dict())
+    expected_metadata = {
+        **notebook_1.metadata.dict(),
+        **notebook_2.metadata.dict(),
+    }
     notebook_1.clear_metadata(
         notebook_metadata_remove=(),
         cell_metadata_remove=(),
@@ -368,29 +381,14 @@ def test_fix__config(tmp_path: Path) -> None:
     assert fixed_notebook.nbformat == notebook_2.nbformat
     assert fixed_notebook.nbformat_minor == notebook_2.nbformat_minor
 
-    expected = notebook_1.cells + [
-        MarkdownCell(
-            metadata=CellMetadata(git_hash=id_main),
-            source=[f"`<<<<<<< {id_main}`"],
-        ),
-        MarkdownCell(
-            source=["`=======`"],
-            metadata=CellMetadata(),
-        ),
-        extra_cell,
-        MarkdownCell(
-            metadata=CellMetadata(git_hash=id_other),
-            source=[f"`>>>>>>> {id_other}`"],
-        ),
-    ]
-
-    assert fixed_notebook.cells == expected
+    assert fixed_notebook.cells == notebook_1.cells + _conflict_marker_cells(
+        id_main=id_main, id_other=id_other, extra_cell=extra_cell
+    )
 
 
-def test_show() -> None:
+def test_show(files_dir: Path) -> None:
     """Show notebook in terminal."""
-    with resources.path("tests.files", "tui-demo.ipynb") as nb_path:
-        result = runner.invoke(app, ["show", str(nb_path)])
+    result = runner.invoke(cli, ["show", str(files_dir / "tui-demo.ipynb")])
     assert result.exit_code == 0
     assert (
         result.output
@@ -463,25 +461,24 @@ In [ ]:
     )
 
 
-def test_show_no_multiple() -> None:
+def test_show_no_multiple(files_dir: Path) -> None:
     """Don't show multiple notebooks if not confirmed in prompt."""
-    with resources.path("tests.files", "tui-demo.ipynb") as nb:
-        dirpath = str(nb.parent)
+    dirpath = str(files_dir)
 
     # Exit code is 0 if user responds to prompt with `n`
-    result = runner.invoke(app, ["show", dirpath], input="n")
+    result = runner.invoke(cli, ["show", dirpath], input="n")
     assert result.exit_code == 0
 
     # Raise error (exit code 1) if no answer to prompt is given
-    result = runner.invoke(app, ["show", dirpath])
+    result = runner.invoke(cli, ["show", dirpath])
     assert result.exit_code == 1
 
 
-def test_diff(tmp_path: Path) -> None:
+def test_diff(tmp_path: Path, repo_template: Path) -> None:
     """Show rich diffs of notebooks."""
     nb_path = Path("test_conflicts_nb.ipynb")
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
+    notebook_1 = make_test_nb()
+    notebook_2 = make_test_nb()
 
     notebook_1.metadata = NotebookMetadata(
         kernelspec=dict(
@@ -502,16 +499,18 @@ def test_diff(tmp_path: Path) -> None:
     _ = init_repo_diff(
         tmp_path=tmp_path,
         filename=nb_path,
-        contents_main=notebook_1.json(),
-        contents_other=notebook_2.json(),
+        contents_main=notebook_1.model_dump_json(),
+        contents_other=notebook_2.model_dump_json(),
         commit_message_main="Notebook from main",
         commit_message_other="Notebook from other",
+        repo_template=repo_template,
     )
 
     # Test passing another branch to compare
-    result = runner.invoke(app, ["diff", "other", str(tmp_path)])
-    assert result.output == dedent(
-        """\
+    result = runner.invoke(cli, ["diff", "other", str(tmp_path)])
+    assert (
+        result.output
+        == """\
 ────── a/test_conflicts_nb.ipynb ───────────── b/test_conflicts_nb.ipynb ───────
                      kernel_display_name           different_kernel_display_name
 In [1]:
@@ -536,9 +535,10 @@ test text
     # Test comparing to index
     notebook_1.cells = notebook_1.cells + [extra_cell]
     notebook_1.write(tmp_path / nb_path, overwrite=True)
-    result = runner.invoke(app, ["diff", str(tmp_path)])
-    assert result.output == dedent(
-        """\
+    result = runner.invoke(cli, ["diff", str(tmp_path)])
+    assert (
+        result.output
+        == """\
 ────── a/test_conflicts_nb.ipynb ───────────── b/test_conflicts_nb.ipynb ───────
                                                    different_kernel_display_name
 In [1]:
@@ -564,11 +564,11 @@ test text
     )
 
 
-def test_diff_svg(tmp_path: Path) -> None:
+def test_diff_svg(tmp_path: Path, repo_template: Path) -> None:
     """Show rich diffs of notebooks."""
     nb_path = Path("test_conflicts_nb.ipynb")
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
+    notebook_1 = make_test_nb()
+    notebook_2 = make_test_nb()
 
     notebook_1.metadata = NotebookMetadata(
         kernelspec=dict(
@@ -589,14 +589,15 @@ def test_diff_svg(tmp_path: Path) -> None:
     _ = init_repo_diff(
         tmp_path=tmp_path,
         filename=nb_path,
-        contents_main=notebook_1.json(),
-        contents_other=notebook_2.json(),
+        contents_main=notebook_1.model_dump_json(),
+        contents_other=notebook_2.model_dump_json(),
         commit_message_main="Notebook from main",
         commit_message_other="Notebook from other",
+        repo_template=repo_template,
     )
 
     # Test passing another branch to compare
-    result = runner.invoke(app, ["diff", "other", str(tmp_path), "-x", "HTML"])
+    result = runner.invoke(cli, ["diff", "other", str(tmp_path), "-x", "HTML"])
     assert (
         result.output
         == """\
@@ -27,3 +27,16 @@ def test_find_obj__missing(tmp_path: Path) -> None:
 
     filepath = find_obj(obj_name=filename, start=start_dir, finish=end_dir)
     assert filepath is None
+
+
+def test_find_obj__not_parent(tmp_path: Path) -> None:
+    """Return `None` when `start` is not a parent directory of `finish`."""
+    filename = "SAMPLE_FILE.ext"
+
+    start_dir = tmp_path / "start"
+    end_dir = tmp_path / "to" / "some" / "dir"
+    start_dir.mkdir()
+    end_dir.mkdir(parents=True)
+    (start_dir / filename).touch()
+
+    assert find_obj(obj_name=filename, start=start_dir, finish=end_dir) is None
@@ -6,14 +6,14 @@ from pytest import raises
 from databooks.conflicts import path2conflicts
 from databooks.data_models.cell import CellMetadata, RawCell
 from databooks.data_models.notebook import NotebookMetadata
-from tests.test_data_models.test_notebook import TestJupyterNotebook
+from tests.test_data_models.test_notebook import make_test_nb
 from tests.test_git_utils import ConflictFile, init_repo_diff
 
 
-def test_path2diff(tmp_path: Path) -> None:
+def test_path2diff(tmp_path: Path, repo_template: Path) -> None:
     """Return a DiffFile based on a path and git conflicts."""
-    notebook_main = TestJupyterNotebook().jupyter_notebook
-    notebook_other = TestJupyterNotebook().jupyter_notebook
+    notebook_main = make_test_nb()
+    notebook_other = make_test_nb()
 
     notebook_main.metadata = NotebookMetadata(
         kernelspec=dict(
@@ -29,17 +29,23 @@ def test_path2diff(tmp_path: Path) -> None:
     notebook_other.cells = notebook_other.cells + [extra_cell]
 
     nb_filepath = Path("test_notebook.ipynb")
+    json_main, json_other = (
+        notebook_main.model_dump_json(),
+        notebook_other.model_dump_json(),
+    )
 
     git_repo = init_repo_diff(
         tmp_path=tmp_path,
         filename=nb_filepath,
-        contents_main=notebook_main.json(),
-        contents_other=notebook_other.json(),
+        contents_main=json_main,
+        contents_other=json_other,
         commit_message_main="Commit message from main",
         commit_message_other="Commit message from other",
+        repo_template=repo_template,
     )
     with raises(GitCommandError):
-        git_repo.git.merge("other")  # merge fails and raises error due to conflict
+        # merge fails and raises error due to conflict (single file, no renames)
+        git_repo.git.merge("other", strategy_option="no-renames")
 
     assert isinstance(git_repo.working_dir, (Path, str))
 
@@ -50,8 +56,8 @@ def test_path2diff(tmp_path: Path) -> None:
     conflict_file = conflict_files[0]
     assert isinstance(conflict_file, ConflictFile)
     assert conflict_file.filename == (git_repo.working_dir / nb_filepath)
-    assert conflict_file.first_contents == notebook_main.json().encode()
-    assert conflict_file.last_contents == notebook_other.json().encode()
+    assert conflict_file.first_contents == json_main.encode()
+    assert conflict_file.last_contents == json_other.encode()
 
     # We use git logs for ids, which start with a hash that won't match
     assert conflict_file.first_log.endswith("Commit message from main")
@@ -1,17 +1,18 @@
 """Test data models for notebook components."""
 import json
 import logging
-from copy import deepcopy
-from importlib import resources
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Optional, Tuple
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 
+from databooks.data_models.base import DiffModel
 from databooks.data_models.cell import (
     CellMetadata,
     CellOutputs,
+    CellStreamOutput,
     CodeCell,
     MarkdownCell,
     RawCell,
@@ -24,26 +25,132 @@ from databooks.data_models.notebook import (
     NotebookMetadata,
 )
 
+empty_cell_metadata = CellMetadata()
+empty_cell_outputs = CellOutputs([])
+CellsOfCell = Cells[Cell]
+CellsOfPairs = Cells[CellsPair]
+
+# Cells for diffs without git hashes - shared across tests, should not be mutated
+extra_cell = RawCell(metadata=CellMetadata(random_meta=["meta"]), source="extra")
+conflict_cells = [
+    MarkdownCell(metadata=CellMetadata(git_hash=None), source=["`<<<<<<< None`"]),
+    MarkdownCell(metadata=empty_cell_metadata, source=["`=======`"]),
+    extra_cell,
+    MarkdownCell(metadata=CellMetadata(git_hash=None), source=["`>>>>>>> None`"]),
+]
+
+
+def _notebook_metadata() -> NotebookMetadata:
+    """Build the `NotebookMetadata` to test on."""
+    return NotebookMetadata.model_construct(
+        kernelspec=dict(display_name="kernel_display_name", name="kernel_name"),
+        field_to_remove="Field to remove",
+        tags=[],
+    )
+
+
+def _cell_metadata() -> CellMetadata:
+    """Build the `CellMetadata` to test on."""
+    return CellMetadata.model_construct(field_to_remove="Field to remove")
+
+
+def _cell() -> CodeCell:
+    """Build the `CodeCell` to test on."""
+    return CodeCell.model_construct(
+        metadata=_cell_metadata(),
+        source=["test_source"],
+        cell_type="code",
+        outputs=CellOutputs.model_construct(
+            [
+                CellStreamOutput.model_construct(
+                    name="stdout", output_type="stream", text=["test text\n"]
+                )
+            ]
+        ),
+        execution_count=1,
+    )
+
+
+def make_test_nb() -> JupyterNotebook:
+    """Build the `JupyterNotebook` to test on (new instance on every call)."""
+    return JupyterNotebook.model_construct(
+        metadata=_notebook_metadata(),
+        nbformat=4,
+        nbformat_minor=4,
+        cells=CellsOfCell.model_construct([_cell()] * 2),
+    )
+
+
+# Models are built once per module - tests that mutate them must copy them first
+
+
+@pytest.fixture(scope="module")
+def notebook_metadata() -> NotebookMetadata:
+    """`NotebookMetadata` fixture to test on."""
+    return _notebook_metadata()
+
+
+@pytest.fixture(scope="module")
+def cell_metadata() -> CellMetadata:
+    """`CellMetadata` fixture to test on."""
+    return _cell_metadata()
+
+
+@pytest.fixture(scope="module")
+def cell() -> CodeCell:
+    """`CodeCell` fixture to test on."""
+    return _cell()
+
+
+@pytest.fixture(scope="module")
+def jupyter_notebook(
+    notebook_metadata: NotebookMetadata, cell: CodeCell
+) -> JupyterNotebook:
+    """`JupyterNotebook` fixture to test on - reuses the metadata and cell fixtures."""
+    return JupyterNotebook.model_construct(
+        metadata=notebook_metadata,
+        nbformat=4,
+        nbformat_minor=4,
+        cells=CellsOfCell.model_construct([cell, cell]),
+    )
+
+
+@pytest.fixture(scope="module")
+def notebook_pair(
+    jupyter_notebook: JupyterNotebook,
+) -> Tuple[JupyterNotebook, JupyterNotebook]:
+    """Notebooks with different metadata and cells to diff."""
+    notebook_1 = jupyter_notebook.model_copy()
+    notebook_2 = jupyter_notebook.model_copy()
+
+    notebook_1.metadata = NotebookMetadata(
+        kernelspec=dict(
+            display_name="different_kernel_display_name", name="kernel_name"
+        ),
+        field_to_remove=["Field to remove"],
+        another_field_to_remove="another field",
+    )
+    notebook_2.cells = notebook_2.cells + [extra_cell]
+    return notebook_1, notebook_2
+
+
+@pytest.fixture(scope="module")
+def notebook_diff(notebook_pair: Tuple[JupyterNotebook, JupyterNotebook]) -> DiffModel:
+    """Diff of `notebook_pair` - shared by the different resolutions."""
+    notebook_1, notebook_2 = notebook_pair
+    return notebook_1 - notebook_2
+
 
 class TestNotebookMetadata:
     """Tests related to notebook metadata fields."""
 
-    @property
-    def notebook_metadata(self) -> NotebookMetadata:
-        """`NotebookMetadata` property to test on."""
-        return NotebookMetadata(
-            kernelspec=dict(display_name="kernel_display_name", name="kernel_name"),
-            field_to_remove="Field to remove",
-            tags=[],
-        )
-
-    def test_remove_fields__missing_ok(self) -> None:
+    def test_remove_fields__missing_ok(
+        self, notebook_metadata: NotebookMetadata
+    ) -> None:
         """Remove fields specified from NotebookMetadata model (ignore if missing)."""
-        metadata = deepcopy(self.notebook_metadata)
+        metadata = notebook_metadata.model_copy(deep=True)
         assert hasattr(metadata, "field_to_remove")
-        extra_fields = [
-            field for field, _ in metadata if field not in metadata.__fields__
-        ]
+        extra_fields = list(metadata.model_extra or {})
 
         with pytest.raises(KeyError):
             metadata.remove_fields(["missing_field"], missing_ok=False)
@@ -53,14 +160,12 @@ class TestNotebookMetadata:
 
         assert not hasattr(metadata, "field_to_remove")
 
-    def test_remove_fields(self) -> None:
+    def test_remove_fields(self, notebook_metadata: NotebookMetadata) -> None:
         """Remove fields specified from NotebookMetadata model."""
-        metadata = deepcopy(self.notebook_metadata)
+        metadata = notebook_metadata.model_copy(deep=True)
         assert hasattr(metadata, "field_to_remove")
         assert hasattr(metadata, "tags")
-        extra_fields = [
-            field for field, _ in metadata if field not in metadata.__fields__
-        ]
+        extra_fields = list(metadata.model_extra or {})
         metadata.remove_fields(extra_fields)
         assert not hasattr(metadata, "field_to_remove")
         assert not hasattr(metadata, "tags")
@@ -69,38 +174,19 @@ class TestNotebookMetadata:
 class TestCell:
     """Tests related to notebook cell fields."""
 
-    @property
-    def cell_metadata(self) -> CellMetadata:
-        """`CellMetadata` property to test on."""
-        return CellMetadata(field_to_remove="Field to remove")
-
-    @property
-    def cell(self) -> CodeCell:
-        """`CodeCell` property to test on."""
-        return CodeCell(
-            metadata=self.cell_metadata,
-            source=["test_source"],
-            execution_count=1,
-            outputs=[
-                {"name": "stdout", "output_type": "stream", "text": ["test text\n"]}
-            ],
-        )
-
-    def test_cell_metadata(self) -> None:
+    def test_cell_metadata(self, cell_metadata: CellMetadata) -> None:
         """Remove fields specified from `CellMetadata` model."""
-        metadata = self.cell_metadata
-        extra_fields = [
-            field for field, _ in metadata if field not in metadata.__fields__
-        ]
+        metadata = cell_metadata.model_copy(deep=True)
+        extra_fields = list(metadata.model_extra or {})
         metadata.remove_fields(extra_fields)
         assert metadata.dict() == {}
-        assert metadata == CellMetadata()
+        assert metadata == empty_cell_metadata
 
-    def test_clear(self, caplog: LogCaptureFixture) -> None:
+    def test_clear(self, cell: CodeCell, caplog: LogCaptureFixture) -> None:
         """Remove metadata specified from notebook `CodeCell`."""
         caplog.set_level(logging.DEBUG)
 
-        cell = self.cell
+        cell = cell.model_copy(deep=True)
 
         assert cell.metadata is not None
 
@@ -108,7 +194,7 @@ class TestCell:
             cell_metadata_keep=[],
             cell_remove_fields=["execution_count", "outputs", "source"],
         )
-        logs = list(caplog.records)
+        logs = caplog.records
 
         assert cell == CodeCell(
             metadata=CellMetadata(),
@@ -121,30 +207,39 @@ class TestCell:
             "Ignoring removal of required fields ['source'] in `CodeCell`."
         )
 
-    def test_cells_sub(self) -> None:
+    def test_cell_hash(self, cell: CodeCell) -> None:
+        """Equal cells have equal hashes (required for diffs)."""
+        other = cell.model_copy(deep=True)
+        assert other == cell and other is not cell
+        assert hash(other) == hash(cell)
+        assert {cell: 1}[other] == 1
+
+    def test_cells_sub(self, cell: CodeCell) -> None:
         """Get the diff from different `Cells`."""
-        dl1 = Cells[Cell]([self.cell])
-        dl2 = Cells[Cell]([self.cell] * 2)
+        dl1 = CellsOfCell.model_construct([cell])
+        dl2 = CellsOfCell.model_construct([cell, cell])
 
         diff = dl1 - dl2
 
-        assert type(dl1) == type(dl2) == Cells[Cell]
-        assert type(diff) == Cells[Tuple[List[Cell], List[Cell]]]
+        assert type(dl1) is type(dl2) is CellsOfCell
+        assert type(diff) is CellsOfPairs
 
-        expected = Cells[CellsPair]([([self.cell], [self.cell]), ([], [self.cell])])
+        expected = CellsOfPairs([([cell], [cell]), ([], [cell])])
 
         assert diff == expected
 
-    def test_cell_remove_fields(self, caplog: LogCaptureFixture) -> None:
+    def test_cell_remove_fields(
+        self, cell: CodeCell, cell_metadata: CellMetadata, caplog: LogCaptureFixture
+    ) -> None:
         """Test remove fields with logs."""
         caplog.set_level(logging.DEBUG)
-        cell = deepcopy(self.cell)
+        cell = cell.model_copy(deep=True)
         cell.remove_fields(["cell_type", "outputs"])
-        logs = list(caplog.records)
+        logs = caplog.records
 
         assert cell.dict() == dict(
             cell_type="code",
-            metadata=self.cell_metadata.dict(),
+            metadata=cell_metadata.dict(),
             source=["test_source"],
             execution_count=1,
             outputs=[],
@@ -155,99 +250,74 @@ class TestCell:
         )
 
 
-class TestJupyterNotebook(TestNotebookMetadata, TestCell):
+class TestJupyterNotebook:
     """Tests related to notebooks."""
 
-    @property
-    def jupyter_notebook(self) -> JupyterNotebook:
-        """`JupyterNotebook` property to test on."""
-        return JupyterNotebook(
-            metadata=self.notebook_metadata,
-            nbformat=4,
-            nbformat_minor=4,
-            cells=[self.cell] * 2,
-        )
-
-    def test_clear_metadata(self) -> None:
+    def test_clear_metadata(self, jupyter_notebook: JupyterNotebook) -> None:
         """Remove metadata specified in JupyterNotebook - cells and notebook levels."""
-        notebook = self.jupyter_notebook
+        notebook = jupyter_notebook.model_copy(deep=True)
         notebook.clear_metadata(
             notebook_metadata_keep=[],
             cell_metadata_keep=[],
             cell_remove_fields=["outputs", "execution_count"],
         )
 
-        assert all(cell.metadata == CellMetadata() for cell in notebook.cells)
-        assert all(
-            cell.outputs == CellOutputs([])
-            for cell in notebook.cells
-            if cell.cell_type == "code"
-        )
-        assert all(
-            cell.execution_count is None
-            for cell in notebook.cells
-            if cell.cell_type == "code"
-        )
-
-    def test_notebook_sub(self) -> None:
+        for cell in notebook.cells:
+            assert cell.metadata == empty_cell_metadata
+            if cell.cell_type == "code":
+                assert cell.outputs == empty_cell_outputs
+                assert cell.execution_count is None
+
+    @pytest.mark.parametrize("keep_first_cells", [True, False, None])
+    def test_notebook_sub(
+        self,
+        notebook_pair: Tuple[JupyterNotebook, JupyterNotebook],
+        notebook_diff: DiffModel,
+        keep_first_cells: Optional[bool],
+    ) -> None:
         """
         Compute and resolve diffs of notebooks.
 
         Use the `-` operator and resolve the diffs from the child classes with nested
          models
         """
-        notebook_1 = deepcopy(self.jupyter_notebook)
-        notebook_2 = deepcopy(self.jupyter_notebook)
+        notebook_1, notebook_2 = notebook_pair
+        expected_cells = {
+            True: notebook_1.cells,
+            False: notebook_2.cells,
+            None: notebook_1.cells + conflict_cells,
+        }[keep_first_cells]
 
-        notebook_1.metadata = NotebookMetadata(
-            kernelspec=dict(
-                display_name="different_kernel_display_name", name="kernel_name"
-            ),
-            field_to_remove=["Field to remove"],
-            another_field_to_remove="another field",
-        )
-        extra_cell = RawCell(
-            metadata=CellMetadata(random_meta=["meta"]),
-            source="extra",
+        # add `tags` since we resolve with default `ignore_none = True`
+        expected = notebook_1.model_copy(
+            update=dict(
+                metadata=notebook_1.metadata.model_copy(update=dict(tags=[])),
+                cells=expected_cells,
+            )
         )
-        notebook_2.cells = notebook_2.cells + [extra_cell]
+        assert notebook_diff.resolve(keep_first_cells=keep_first_cells) == expected
 
-        diff = notebook_1 - notebook_2
-        notebook = deepcopy(notebook_1)
 
-        # add `tags` since we resolve with default `ignore_none = True`
-        notebook.metadata = NotebookMetadata(
-            **notebook_1.metadata.dict(), **{"tags": []}
-        )
+@lru_cache(maxsize=None)
+def _jupyter_notebook_json() -> bytes:
+    """Serialize the test notebook once (`make_test_nb`)."""
+    return make_test_nb().model_dump_json().encode()
 
-        assert diff.resolve(keep_first_cells=True) == notebook
 
-        notebook.cells = notebook_2.cells
-        assert diff.resolve(keep_first_cells=False) == notebook
+def write_test_nb(path: Path) -> None:
+    """Write the test notebook to `path` (skip model construction and validation)."""
+    path.write_bytes(_jupyter_notebook_json())
 
-        notebook.cells = notebook_1.cells + [
-            MarkdownCell(
-                metadata=CellMetadata(git_hash=None),
-                source=["`<<<<<<< None`"],
-            ),
-            MarkdownCell(
-                source=["`=======`"],
-                metadata=CellMetadata(),
-            ),
-            extra_cell,
-            MarkdownCell(
-                metadata=CellMetadata(git_hash=None),
-                source=["`>>>>>>> None`"],
-            ),
-        ]
-        assert diff.resolve(keep_first_cells=None) == notebook
 
+@pytest.fixture(scope="module")
+def demo_nb(files_dir: Path) -> JupyterNotebook:
+    """Parse `demo.ipynb` once - shared by parsing and writing tests."""
+    return JupyterNotebook.parse_file(files_dir / "demo.ipynb")
 
-def test_parse_file() -> None:
-    """Deserialize `ipynb` file to `databooks.JupyterNotebook` models."""
-    with resources.path("tests.files", "demo.ipynb") as nb_path:
-        notebook = JupyterNotebook.parse_file(nb_path)
 
+def test_parse_file(demo_nb: JupyterNotebook) -> None:
+    """Deserialize `ipynb` file to `databooks.JupyterNotebook` models."""
+    notebook = demo_nb
     assert notebook.nbformat == 4
     assert notebook.nbformat_minor == 5
     assert notebook.metadata == NotebookMetadata(
@@ -273,7 +343,7 @@ def test_parse_file() -> None:
         },
     )
 
-    expected_cells = Cells[Cell](
+    expected_cells = CellsOfCell(
         [
             MarkdownCell(
                 metadata=CellMetadata(tags=[]),
@@ -346,14 +416,12 @@ def test_parse_file() -> None:
     assert notebook.cells == expected_cells
 
 
-def test_write_file(tmp_path: Path) -> None:
+def test_write_file(tmp_path: Path, files_dir: Path, demo_nb: JupyterNotebook) -> None:
     """Check that serialization and deserialization are valid."""
     write_path = tmp_path / "serialized_demo.ipynb"
-    with resources.path("tests.files", "demo.ipynb") as nb_path:
-        notebook = JupyterNotebook.parse_file(nb_path)
-        in_json_str = nb_path.read_text(encoding="utf-8")
+    in_json_str = (files_dir / "demo.ipynb").read_text(encoding="utf-8")
 
-    notebook.write(write_path)
+    demo_nb.write(write_path)
     out_json_str = write_path.read_text(encoding="utf-8")
     assert json.loads(in_json_str) == json.loads(out_json_str)
     assert in_json_str != out_json_str
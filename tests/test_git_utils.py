@@ -1,6 +1,10 @@
+from io import BytesIO
 from pathlib import Path
+from shutil import copytree
 
-from git import GitCommandError, Repo
+from git import Blob, GitCommandError, Repo
+from git.index.typ import BaseIndexEntry
+from gitdb import IStream
 from pytest import raises
 
 from databooks.data_models.cell import CellMetadata, RawCell
@@ -14,7 +18,7 @@ from databooks.git_utils import (
     get_nb_diffs,
     get_repo,
 )
-from tests.test_data_models.test_notebook import TestJupyterNotebook
+from tests.test_data_models.test_notebook import make_test_nb
 
 
 def init_repo_diff(
@@ -24,9 +28,12 @@ def init_repo_diff(
     contents_other: str,
     commit_message_main: str,
     commit_message_other: str,
+    *,
+    repo_template: Path,
 ) -> Repo:
-    """Create git repo and create a conflict."""
-    git_repo = Repo.init(path=tmp_path)
+    """Create git repo (from `repo_template` fixture) and create a conflict."""
+    copytree(repo_template / ".git", tmp_path / ".git")
+    git_repo = Repo(path=tmp_path)
 
     if not isinstance(git_repo.working_dir, (Path, str)):
         raise RuntimeError(
@@ -35,22 +42,23 @@ def init_repo_diff(
 
     git_filepath = git_repo.working_dir / filename
 
-    git_repo.git.checkout("-b", "main")
-    git_repo.git.commit("--allow-empty", "-m", "Initial commit")
-
-    git_repo.git.checkout("-b", "other")
-    git_filepath.parent.mkdir(parents=True, exist_ok=True)
-    with git_filepath.open("w") as f:
-        f.write(contents_other)
-    git_repo.git.add(filename)
-    git_repo.git.commit("-m", commit_message_other)
+    # Commit to `other` without checking it out (`head=False` keeps `main` as HEAD)
+    #  and write its blob straight to the object database - only `main` is on disk
+    data_other = contents_other.encode()
+    blob_other = git_repo.odb.store(
+        IStream(Blob.type, len(data_other), BytesIO(data_other))
+    )
+    git_repo.index.add(
+        [BaseIndexEntry((Blob.file_mode, blob_other.binsha, 0, filename.as_posix()))]
+    )
+    git_repo.create_head(
+        "other", git_repo.index.commit(commit_message_other, head=False)
+    )
 
-    git_repo.git.checkout("main")
     git_filepath.parent.mkdir(parents=True, exist_ok=True)
-    with git_filepath.open("w") as f:
-        f.write(contents_main)
-    git_repo.git.add(filename)
-    git_repo.git.commit("-m", commit_message_main)
+    git_filepath.write_text(contents_main)
+    git_repo.index.add([str(filename)])
+    git_repo.index.commit(commit_message_main)
 
     return git_repo
 
@@ -69,7 +77,7 @@ def test_get_repo_missing(tmp_path: Path) -> None:
     assert get_repo(tmp_path) is None
 
 
-def test_get_conflict_blobs(tmp_path: Path) -> None:
+def test_get_conflict_blobs(tmp_path: Path, repo_template: Path) -> None:
     """Return `databooks.git_utils.ConflctFile` from git merge conflict."""
     filepath = Path("hello.txt")
     git_repo = init_repo_diff(
@@ -79,9 +87,11 @@ def test_get_conflict_blobs(tmp_path: Path) -> None:
         contents_other="hello world",
         commit_message_main="Commit message from main",
         commit_message_other="Commit message from other",
+        repo_template=repo_template,
     )
     with raises(GitCommandError):
-        git_repo.git.merge("other")  # merge fails and raises error due to conflict
+        # merge fails and raises error due to conflict (single file, no renames)
+        git_repo.git.merge("other", strategy_option="no-renames")
 
     assert isinstance(git_repo.working_dir, (Path, str))
 
@@ -100,10 +110,10 @@ def test_get_conflict_blobs(tmp_path: Path) -> None:
     assert conflict.last_contents == b"hello world"
 
 
-def test_get_nb_diffs(tmp_path: Path) -> None:
+def test_get_nb_diffs(tmp_path: Path, repo_template: Path) -> None:
     """Get the diffs for notebooks."""
-    notebook_main = TestJupyterNotebook().jupyter_notebook
-    notebook_other = TestJupyterNotebook().jupyter_notebook
+    notebook_main = make_test_nb()
+    notebook_other = make_test_nb()
 
     notebook_main.metadata = NotebookMetadata(
         kernelspec=dict(
@@ -119,24 +129,27 @@ def test_get_nb_diffs(tmp_path: Path) -> None:
     notebook_other.cells = notebook_other.cells + [extra_cell]
 
     nb_filepath = Path("test_notebook.ipynb")
+    json_main, json_other = (
+        notebook_main.model_dump_json(),
+        notebook_other.model_dump_json(),
+    )
 
     git_repo = init_repo_diff(
         tmp_path=tmp_path,
         filename=nb_filepath,
-        contents_main=notebook_main.json(),
-        contents_other=notebook_other.json(),
+        contents_main=json_main,
+        contents_other=json_other,
         commit_message_main="Commit message from main",
         commit_message_other="Commit message from other",
+        repo_template=repo_template,
     )
 
     assert get_nb_diffs(repo=git_repo, ref_remote="other") == [
         DiffContents(
-            a=Contents(
-                path=Path("test_notebook.ipynb"), contents=notebook_main.json().encode()
-            ),
+            a=Contents(path=Path("test_notebook.ipynb"), contents=json_main.encode()),
             b=Contents(
                 path=Path("test_notebook.ipynb"),
-                contents=notebook_other.json().encode(),
+                contents=json_other.encode(),
             ),
             change_type=ChangeType.M,
         )
@@ -2,21 +2,44 @@ import logging
 from pathlib import Path
 
 from _pytest.logging import LogCaptureFixture
+from _pytest.tmpdir import TempPathFactory
+from pytest import fixture
 
 from databooks.data_models.cell import CellMetadata, CellOutputs
 from databooks.data_models.notebook import JupyterNotebook
 from databooks.metadata import clear
-from tests.test_data_models.test_notebook import TestJupyterNotebook
+from tests.test_data_models.test_notebook import make_test_nb, write_test_nb
+
+empty_cell_metadata = CellMetadata()
+expected_outputs = CellOutputs(
+    [{"name": "stdout", "output_type": "stream", "text": ["test text\n"]}]
+)
+
+
+@fixture(scope="module")
+def test_nb() -> JupyterNotebook:
+    """Test notebook shared by the module - same as the one in `write_test_nb`."""
+    return make_test_nb()
+
+
+@fixture(scope="module")
+def test_nb_path(tmp_path_factory: TempPathFactory) -> Path:
+    """Test notebook written once for the module - tests only read from it."""
+    read_path = tmp_path_factory.mktemp("metadata") / "test_nb.ipynb"
+    write_test_nb(read_path)
+    return read_path
 
 
 def test_metadata_clear__check_verbose(
-    tmp_path: Path, caplog: LogCaptureFixture
+    tmp_path: Path,
+    caplog: LogCaptureFixture,
+    test_nb: JupyterNotebook,
+    test_nb_path: Path,
 ) -> None:
     """Clear metadata from a notebook and write clean notebook."""
     caplog.set_level(logging.DEBUG)
-    read_path = tmp_path / "test_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(read_path)
-    write_path = read_path.parent / f"clean_{read_path.name}"
+    read_path = test_nb_path
+    write_path = tmp_path / f"clean_{read_path.name}"
 
     clear(
         read_path=read_path,
@@ -25,12 +48,9 @@ def test_metadata_clear__check_verbose(
         check=True,
         verbose=True,
     )
-    logs = list(caplog.records)
+    logs = caplog.records
 
-    assert (
-        JupyterNotebook.parse_file(path=read_path)
-        == TestJupyterNotebook().jupyter_notebook
-    )
+    assert JupyterNotebook.parse_file(path=read_path) == test_nb
 
     assert not write_path.exists()
     assert len(logs) == 2
@@ -39,11 +59,12 @@ def test_metadata_clear__check_verbose(
     )
 
 
-def test_metadata_clear(tmp_path: Path) -> None:
+def test_metadata_clear(
+    tmp_path: Path, test_nb: JupyterNotebook, test_nb_path: Path
+) -> None:
     """Clear metadata from a notebook and write clean notebook."""
-    read_path = tmp_path / "test_nb.ipynb"  # type: ignore
-    TestJupyterNotebook().jupyter_notebook.write(read_path)
-    write_path = read_path.parent / f"clean_{read_path.name}"
+    read_path = test_nb_path
+    write_path = tmp_path / f"clean_{read_path.name}"
 
     clear(
         read_path=read_path,
@@ -51,32 +72,15 @@ def test_metadata_clear(tmp_path: Path) -> None:
         cell_fields_keep=["cell_type", "source", "metadata", "outputs"],
     )
 
-    nb_read = JupyterNotebook.parse_file(path=read_path)
     nb_write = JupyterNotebook.parse_file(path=write_path)
 
     assert write_path.exists()
-    assert len(nb_write.cells) == len(nb_read.cells)
-    assert all(cell.metadata == CellMetadata() for cell in nb_write.cells)
-    assert all(
-        cell.outputs
-        == CellOutputs(
-            [{"name": "stdout", "output_type": "stream", "text": ["test text\n"]}]
-        )
-        for cell in nb_write.cells
-        if cell.cell_type == "code"
-    )
-    assert all(
-        cell.execution_count is None
-        for cell in nb_write.cells
-        if cell.cell_type == "code"
-    )
-    assert all(
-        not hasattr(cell, "outputs")
-        for cell in nb_write.cells
-        if cell.cell_type != "code"
-    )
-    assert all(
-        not hasattr(cell, "execution_count")
-        for cell in nb_write.cells
-        if cell.cell_type != "code"
-    )
+    assert len(nb_write.cells) == len(test_nb.cells)
+    for cell in nb_write.cells:
+        assert cell.metadata == empty_cell_metadata
+        if cell.cell_type == "code":
+            assert cell.outputs == expected_outputs
+            assert cell.execution_count is None
+        else:
+            assert "outputs" not in cell.model_fields_set
+            assert "execution_count" not in cell.model_fields_set
@@ -1,101 +1,122 @@
-from importlib import resources
 from pathlib import Path
 
+from pytest import fixture
+
 from databooks.affirm import affirm
+from databooks.data_models.notebook import JupyterNotebook
 from databooks.recipes import CookBook
 
 
+@fixture(scope="module")
+def demo_path(files_dir: Path) -> Path:
+    """Path of the notebook that passes all the recipes."""
+    return files_dir / "demo.ipynb"
+
+
+@fixture(scope="module")
+def demo_nb(demo_path: Path) -> JupyterNotebook:
+    """Parse the passing notebook once for all recipes."""
+    return JupyterNotebook.parse_file(demo_path)
+
+
+@fixture(scope="module")
+def bad_demo_path(files_dir: Path) -> Path:
+    """Path of the notebook that fails all the recipes."""
+    return files_dir / "bad-demo.ipynb"
+
+
+@fixture(scope="module")
+def bad_demo_nb(bad_demo_path: Path) -> JupyterNotebook:
+    """Parse the failing notebook once for all recipes."""
+    return JupyterNotebook.parse_file(bad_demo_path)
+
+
 class TestCookBookGood:
     """Ensure desired effect for recipes."""
 
-    @property
-    def nb(self) -> Path:
-        """Notebook file for easy access."""
-        with resources.path("tests.files", "demo.ipynb") as nb:
-            return nb
-
-    def test_has_tags(self) -> None:
+    def test_has_tags(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that notebook cells have flags."""
         recipe = CookBook.has_tags.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_has_tags_code(self) -> None:
+    def test_has_tags_code(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that the code cells have flags."""
         recipe = CookBook.has_tags_code.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_max_cells(self) -> None:
+    def test_max_cells(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that notebook has less than 128 cells."""
         recipe = CookBook.max_cells.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_seq_exec(self) -> None:
+    def test_seq_exec(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that the notebook code cells are executed in order."""
         recipe = CookBook.seq_exec.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_seq_increase(self) -> None:
+    def test_seq_increase(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that the notebook code cells are executed monotonically."""
         recipe = CookBook.seq_increase.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_startswith_md(self) -> None:
+    def test_startswith_md(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that the notebook's first cell is a markdown cell."""
         recipe = CookBook.startswith_md.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_no_empty_code(self) -> None:
+    def test_no_empty_code(self, demo_path: Path, demo_nb: JupyterNotebook) -> None:
         """Ensure that the notebook contains no empty code cells."""
         recipe = CookBook.no_empty_code.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is True
+        assert affirm(nb_path=demo_path, exprs=[recipe], nb=demo_nb) is True
 
-    def test_seq_exec__clean(self) -> None:
+    def test_seq_exec__clean(self, files_dir: Path) -> None:
         """If no cells are executed then no cells are executed out of order."""
         recipe = CookBook.seq_exec.src
-        with resources.path("tests.files", "clean.ipynb") as nb:
-            assert affirm(nb_path=nb, exprs=[recipe]) is True
+        assert affirm(nb_path=files_dir / "clean.ipynb", exprs=[recipe]) is True
 
 
 class TestCookBookBad:
     """Ensure desired effect for recipes."""
 
-    @property
-    def nb(self) -> Path:
-        """Notebook file for easy access."""
-        with resources.path("tests.files", "bad-demo.ipynb") as nb:
-            return nb
-
-    def test_has_tags(self) -> None:
+    def test_has_tags(self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook) -> None:
         """Check failure when notebook cells have no flags."""
         recipe = CookBook.has_tags.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_has_tags_code(self) -> None:
+    def test_has_tags_code(
+        self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook
+    ) -> None:
         """Check failure when code cells have no flags."""
         recipe = CookBook.has_tags_code.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_max_cells(self) -> None:
+    def test_max_cells(self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook) -> None:
         """Check failure when notebook has more than 128 cells."""
         recipe = CookBook.max_cells.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_seq_exec(self) -> None:
+    def test_seq_exec(self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook) -> None:
         """Check failure when notebook code cells are executed out of order."""
         recipe = CookBook.seq_exec.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_seq_increase(self) -> None:
+    def test_seq_increase(
+        self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook
+    ) -> None:
         """Check failure when notebook code cells are not executed monotonically."""
         recipe = CookBook.seq_increase.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_startswith_md(self) -> None:
+    def test_startswith_md(
+        self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook
+    ) -> None:
         """Check failure when notebook's first cell is not a markdown cell."""
         recipe = CookBook.startswith_md.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
 
-    def test_no_empty_code(self) -> None:
+    def test_no_empty_code(
+        self, bad_demo_path: Path, bad_demo_nb: JupyterNotebook
+    ) -> None:
         """Check failure when notebook contains empty code cells."""
         recipe = CookBook.no_empty_code.src
-        assert affirm(nb_path=self.nb, exprs=[recipe]) is False
+        assert affirm(nb_path=bad_demo_path, exprs=[recipe], nb=bad_demo_nb) is False
@@ -1,16 +1,15 @@
 import io
-from importlib import resources
+from pathlib import Path
 from textwrap import dedent
 
+from pytest import fixture
 from rich.console import Console, ConsoleRenderable
 
 from databooks.data_models.cell import CellMetadata, RawCell
 from databooks.data_models.notebook import JupyterNotebook, NotebookMetadata
-from databooks.tui import nb2rich
-from tests.test_data_models.test_notebook import TestJupyterNotebook
-
-with resources.path("tests.files", "tui-demo.ipynb") as nb_path:
-    nb = JupyterNotebook.parse_file(nb_path)
+from databooks.git_utils import ChangeType, Contents, DiffContents
+from databooks.tui import ImgFmt, diff2rich, nb2rich, nbs2rich
+from tests.test_data_models.test_notebook import make_test_nb
 
 rich_nb = """\
                               Python 3 (ipykernel)
@@ -78,14 +77,24 @@ In [ ]:
 """
 
 
+_console = Console(file=io.StringIO(), width=50, legacy_windows=False)
+
+
 def render(obj: ConsoleRenderable, width: int = 50) -> str:
-    """Render object to string (instead of terminal)."""
-    console = Console(file=io.StringIO(), width=width, legacy_windows=False)
-    console.print(obj)
-    return console.file.getvalue()
+    """Render object to string (instead of terminal) - reuse the module's console."""
+    _console.file = io.StringIO()
+    _console.width = width
+    _console.print(obj)
+    return _console.file.getvalue()
+
 
+@fixture(scope="module")
+def nb(files_dir: Path) -> JupyterNotebook:
+    """Parse `tui-demo.ipynb` once, only when a test needs it."""
+    return JupyterNotebook.parse_file(files_dir / "tui-demo.ipynb")
 
-def test_code_cell() -> None:
+
+def test_code_cell(nb: JupyterNotebook) -> None:
     """Prints code cell with no outputs."""
     assert render(nb.cells[1]) == dedent(
         """\
@@ -97,7 +106,7 @@ In [1]:
     )
 
 
-def test_code_cell_outputs() -> None:
+def test_code_cell_outputs(nb: JupyterNotebook) -> None:
     """Prints code cell with outputs."""
     assert render(nb.cells[2]) == dedent(
         """\
@@ -111,7 +120,7 @@ Out [2]:
     )
 
 
-def test_code_cell_error() -> None:
+def test_code_cell_error(nb: JupyterNotebook) -> None:
     """Prints code cell with errors."""
     assert render(nb.cells[4]) == dedent(
         """\
@@ -127,7 +136,7 @@ SyntaxError: invalid syntax
     )
 
 
-def test_code_cell_df() -> None:
+def test_code_cell_df(nb: JupyterNotebook) -> None:
     """Prints code cell data frame and has print statement."""
     assert render(nb.cells[6]) == (
         """\
@@ -160,7 +169,7 @@ Out [5]:
     )
 
 
-def test_md_cell() -> None:
+def test_md_cell(nb: JupyterNotebook) -> None:
     """Prints markdown cell."""
     assert render(nb.cells[0]) == dedent(
         """\
@@ -173,7 +182,7 @@ def test_md_cell() -> None:
     )
 
 
-def test_raw_cell() -> None:
+def test_raw_cell(nb: JupyterNotebook) -> None:
     """Prints raw cell."""
     assert render(nb.cells[5]) == dedent(
         """\
@@ -184,25 +193,34 @@ def test_raw_cell() -> None:
     )
 
 
-def test_notebook() -> None:
+def test_notebook(nb: JupyterNotebook) -> None:
     """Prints notebook (identical to printing all cells)."""
     assert render(nb) == rich_nb
 
 
-def test_print_nb() -> None:
+def test_print_nb(files_dir: Path) -> None:
     """Print notebook from path and add rules with file name."""
     console = Console(file=io.StringIO(), width=50, legacy_windows=False)
-    with resources.path("tests.files", "tui-demo.ipynb") as path:
-        nb2rich(path, console=console)
+    nb2rich(files_dir / "tui-demo.ipynb", console=console)
     assert console.file.getvalue() == "\n".join(
         ("───────────────── tui-demo.ipynb ─────────────────", rich_nb)
     )
 
 
+def test_print_nbs__export_out(files_dir: Path) -> None:
+    """Write exported notebooks to file-like object instead of returning them."""
+    out = io.StringIO()
+    path = files_dir / "tui-demo.ipynb"
+    exported = nbs2rich([path], context=ImgFmt.text, width=50)
+    assert nbs2rich([path], context=ImgFmt.text, out=out, width=50) is None
+    assert out.getvalue() == exported
+    assert exported.startswith("───────────────── tui-demo.ipynb ─────────────────")
+
+
 def test_diff_nb() -> None:
     """Show rich representation of 'diff' notebook."""
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
+    notebook_1 = make_test_nb()
+    notebook_2 = make_test_nb()
     extra_cell = RawCell(
         metadata=CellMetadata(random_meta=["meta"]),
         source="extra",
@@ -234,8 +252,8 @@ test text
 
 def test_multiple_diff_nb() -> None:
     """Show rich representation of 'diff' notebook."""
-    notebook_1 = TestJupyterNotebook().jupyter_notebook
-    notebook_2 = TestJupyterNotebook().jupyter_notebook
+    notebook_1 = make_test_nb()
+    notebook_2 = make_test_nb()
     notebook_2.metadata = NotebookMetadata(
         kernelspec=dict(display_name="another_kernel", name="kernel_name"),
     )
@@ -278,3 +296,21 @@ test text
                           ╰──────────────────────╯
 """
     )
+
+
+def test_diff_nb__same_contents() -> None:
+    """Skip computing the notebook diff when the contents are identical."""
+    console = Console(file=io.StringIO(), width=50, legacy_windows=False)
+    contents = make_test_nb().model_dump_json()
+    diff = DiffContents(
+        a=Contents(path=Path("nb.ipynb"), contents=contents),
+        b=Contents(path=Path("nb.ipynb"), contents=contents),
+        change_type=ChangeType.M,
+    )
+    diff2rich(diff, console=console)
+    assert console.file.getvalue() == dedent(
+        """\
+────── a/nb.ipynb ───────────── b/nb.ipynb ───────
+─────────────── (no content diff) ────────────────
+"""
+    )